@@ -11,8 +11,7 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import random
 import time
-from typing import List, Tuple, Optional
-from dataclasses import dataclass
+from typing import Dict, List, Tuple, Optional
 from enum import Enum
 
 class Difficulty(Enum):
@@ -21,12 +20,46 @@ class Difficulty(Enum):
     HARD = 5
     EXPERT = 6
 
-@dataclass
 class GameStats:
-    moves: int = 0
-    start_time: float = 0
-    elapsed_time: float = 0
-    is_solvable: bool = True
+    __slots__ = ('moves', 'start_time', 'elapsed_time', 'is_solvable')
+    
+    def __init__(self):
+        self.moves = 0
+        self.start_time = 0.0
+        self.elapsed_time = 0.0
+        self.is_solvable = True
+
+# Per-size constants, computed once per difficulty and then reused
+_SOLVED_CACHE: Dict[int, bytes] = {}
+_NEIGHBORS_CACHE: Dict[int, List[frozenset]] = {}
+
+def _solved_layout(size: int) -> bytes:
+    """Get the solved grid for a board size (tiles 1..n, blank last)"""
+    solved = _SOLVED_CACHE.get(size)
+    if solved is None:
+        solved = bytes(range(1, size * size)) + b"\x00"
+        _SOLVED_CACHE[size] = solved
+    return solved
+
+def _neighbor_table(size: int) -> List[frozenset]:
+    """Get, for every flat index of a board size, the flat indices adjacent to it"""
+    table = _NEIGHBORS_CACHE.get(size)
+    if table is None:
+        table = []
+        for idx in range(size * size):
+            row, col = divmod(idx, size)
+            neighbors = []
+            if row > 0:
+                neighbors.append(idx - size)
+            if row < size - 1:
+                neighbors.append(idx + size)
+            if col > 0:
+                neighbors.append(idx - 1)
+            if col < size - 1:
+                neighbors.append(idx + 1)
+            table.append(frozenset(neighbors))
+        _NEIGHBORS_CACHE[size] = table
+    return table
 
 class SlidingPuzzleGame:
     """
@@ -37,111 +70,97 @@ class SlidingPuzzleGame:
     def __init__(self, difficulty: Difficulty = Difficulty.EASY):
         self.difficulty = difficulty
         self.size = difficulty.value
-        self.grid: List[List[int]] = []
-        self.blank_pos: Tuple[int, int] = (0, 0)
+        # Flat row-major grid: tile at (row, col) lives at row * size + col
+        self.grid = bytearray(self.size * self.size)
+        self.blank_pos: int = 0
+        # Flat indices of the tiles next to the blank, i.e. the movable ones
+        self._blank_neighbors: frozenset = frozenset()
+        # Neighbor table for the current size, indexed by flat position
+        self._neighbors: List[frozenset] = []
+        # Solved layout for the current size, compared against in is_solved
+        self._goal = b""
         self.stats = GameStats()
+        # Inversion parity of the whole grid (blank counted as the largest
+        # tile); every swap of two cells flips it
+        self._inv_parity = 0
         self.generate_solvable_puzzle()
     
     def generate_solvable_puzzle(self) -> None:
         """Generate a solvable puzzle using AI-based algorithms"""
-        # Create solved puzzle
-        self.grid = [[row * self.size + col + 1 for col in range(self.size)] 
-                    for row in range(self.size)]
-        self.grid[self.size - 1][self.size - 1] = 0  # Blank tile
-        self.blank_pos = (self.size - 1, self.size - 1)
+        # Create solved puzzle (blank tile last), copied in one go from the goal
+        self._goal = _solved_layout(self.size)
+        self._neighbors = _neighbor_table(self.size)
+        self.grid = bytearray(self._goal)
         
-        # Shuffle while maintaining solvability
-        self.grid = self._shuffle_puzzle()
-        self.blank_pos = self._find_blank_position()
+        # Shuffle in place, then restore solvability if needed
+        blank_pos, self._inv_parity = self._shuffle_puzzle()
+        self._set_blank_pos(blank_pos)
         
-        # Verify and ensure solvability
+        # Verify and ensure solvability (the fix never moves the blank)
         if not self._check_solvability():
             self._make_solvable()
-            self.blank_pos = self._find_blank_position()
         
         self.stats = GameStats()
-        self.stats.start_time = time.time()
+        self.stats.start_time = time.monotonic()
     
-    def _shuffle_puzzle(self) -> List[List[int]]:
-        """Shuffle puzzle using valid moves to maintain solvability"""
-        shuffled = [row[:] for row in self.grid]
-        blank_row, blank_col = self.blank_pos
-        
-        # Perform random valid moves
-        for _ in range(self.size * self.size * 10):
-            directions = [(0, 1), (0, -1), (1, 0), (-1, 0)]
-            random.shuffle(directions)
-            
-            for dr, dc in directions:
-                new_row, new_col = blank_row + dr, blank_col + dc
-                if (0 <= new_row < self.size and 0 <= new_col < self.size):
-                    # Swap blank with adjacent tile
-                    shuffled[blank_row][blank_col] = shuffled[new_row][new_col]
-                    shuffled[new_row][new_col] = 0
-                    blank_row, blank_col = new_row, new_col
-                    break
-        
-        return shuffled
+    def _shuffle_puzzle(self) -> Tuple[int, int]:
+        """Shuffle the solved grid in place, returning blank index and parity"""
+        grid = self.grid
+        randrange = random.randrange
+        blank = len(grid) - 1
+        parity = 0
+        
+        # Fisher-Yates shuffle; half of the results are unsolvable and get
+        # fixed up by _make_solvable in generate_solvable_puzzle. The blank
+        # and parity are tracked in the same pass, so no rescan is needed
+        for i in range(len(grid) - 1, 0, -1):
+            j = randrange(i + 1)
+            if i != j:
+                grid[i], grid[j] = grid[j], grid[i]
+                parity ^= 1
+                if blank == i:
+                    blank = j
+                elif blank == j:
+                    blank = i
+        
+        return blank, parity
     
     def _check_solvability(self) -> bool:
         """
-        AI-based solvability checker using inversion count algorithm
-        Same logic as SwiftUI implementation
+        AI-based solvability checker using inversion parity
+        Solvable when the parity matches the blank's distance from the
+        bottom-right corner (equivalent to the SwiftUI inversion count rule)
         """
-        # Flatten puzzle (excluding blank)
-        flat_puzzle = [num for row in self.grid for num in row if num != 0]
-        
-        # Count inversions
-        inversions = 0
-        for i in range(len(flat_puzzle)):
-            for j in range(i + 1, len(flat_puzzle)):
-                if flat_puzzle[i] > flat_puzzle[j]:
-                    inversions += 1
-        
-        # For odd-sized puzzles: solvable if inversions are even
-        if self.size % 2 == 1:
-            return inversions % 2 == 0
-        
-        # For even-sized puzzles: consider blank position
-        blank_row = self._find_blank_position()[0]
-        blank_from_bottom = self.size - blank_row
-        return (inversions + blank_from_bottom) % 2 == 1
+        size = self.size
+        blank_row, blank_col = divmod(self.blank_pos, size)
+        distance = 2 * (size - 1) - blank_row - blank_col
+        return self._inv_parity == distance % 2
     
     def _make_solvable(self) -> None:
         """Make unsolvable puzzle solvable by swapping two non-blank tiles"""
-        non_blank_tiles = []
-        for row in range(self.size):
-            for col in range(self.size):
-                if self.grid[row][col] != 0:
-                    non_blank_tiles.append((row, col))
+        grid = self.grid
         
-        if len(non_blank_tiles) >= 2:
-            # Swap first two non-blank tiles
-            r1, c1 = non_blank_tiles[0]
-            r2, c2 = non_blank_tiles[1]
-            self.grid[r1][c1], self.grid[r2][c2] = self.grid[r2][c2], self.grid[r1][c1]
+        # Swap first two non-blank tiles; with a single blank they always
+        # sit within the first three cells, so no list of tiles is needed
+        i = 0 if grid[0] != 0 else 1
+        j = i + 1 if grid[i + 1] != 0 else i + 2
+        self._swap(i, j)
     
-    def _find_blank_position(self) -> Tuple[int, int]:
-        """Find position of blank tile (0)"""
-        for row in range(self.size):
-            for col in range(self.size):
-                if self.grid[row][col] == 0:
-                    return (row, col)
-        return (0, 0)
+    def _swap(self, i: int, j: int) -> None:
+        """Swap the cells at flat indices i and j, flipping the inversion parity"""
+        grid = self.grid
+        grid[i], grid[j] = grid[j], grid[i]
+        self._inv_parity ^= 1
+    
+    def _set_blank_pos(self, idx: int) -> None:
+        """Move the blank to flat index idx and look up its neighbors"""
+        self.blank_pos = idx
+        self._blank_neighbors = self._neighbors[idx]
     
     def can_move_tile(self, row: int, col: int) -> bool:
         """Check if tile at (row, col) can be moved"""
-        if not (0 <= row < self.size and 0 <= col < self.size):
-            return False
-        if self.grid[row][col] == 0:
-            return False
-        
-        # Check if blank is adjacent
-        blank_row, blank_col = self.blank_pos
-        row_diff = abs(row - blank_row)
-        col_diff = abs(col - blank_col)
-        
-        return (row_diff == 1 and col_diff == 0) or (row_diff == 0 and col_diff == 1)
+        # Out-of-range rows map outside the grid; only the column can wrap
+        return 0 <= col < self.size and row * self.size + col in self._blank_neighbors
     
     def move_tile(self, row: int, col: int) -> bool:
         """Move tile at (row, col) to blank position"""
@@ -149,28 +168,20 @@ class SlidingPuzzleGame:
             return False
         
         # Swap tiles
-        self.grid[self.blank_pos[0]][self.blank_pos[1]] = self.grid[row][col]
-        self.grid[row][col] = 0
-        self.blank_pos = (row, col)
+        idx = row * self.size + col
+        self._swap(self.blank_pos, idx)
+        self._set_blank_pos(idx)
         self.stats.moves += 1
         
         return True
     
     def is_solved(self) -> bool:
         """Check if puzzle is solved"""
-        expected = 1
-        for row in range(self.size):
-            for col in range(self.size):
-                if row == self.size - 1 and col == self.size - 1:
-                    return self.grid[row][col] == 0
-                if self.grid[row][col] != expected:
-                    return False
-                expected += 1
-        return True
+        return self.grid == self._goal
     
     def get_elapsed_time(self) -> float:
         """Get elapsed time in seconds"""
-        return time.time() - self.stats.start_time
+        return time.monotonic() - self.stats.start_time
 
 class SlidingPuzzleGUI:
     """
@@ -187,6 +198,9 @@ class SlidingPuzzleGUI:
         # Game instance
         self.game = SlidingPuzzleGame()
         self.tile_buttons = []
+        # Whole seconds shown on the clock, advanced by the Tk timer
+        self._tick_seconds = 0
+        self._timer_id = None
         
         self.setup_ui()
         self.update_display()
@@ -296,62 +310,109 @@ class SlidingPuzzleGUI:
             pady=10
         )
         info_btn.pack(side=tk.LEFT, padx=5)
+        
+        self.create_tile_buttons()
     
     def create_tile_buttons(self):
-        """Create tile buttons for the puzzle"""
+        """Create tile buttons for the puzzle (only needed when the size changes)"""
         # Clear existing buttons
         for widget in self.game_frame.winfo_children():
             widget.destroy()
+        # Flat list in the same row-major order as the game grid
         self.tile_buttons = []
         
         # Calculate tile size
         tile_size = min(400 // self.game.size, 60)
         
         for row in range(self.game.size):
-            button_row = []
             for col in range(self.game.size):
                 btn = tk.Button(
                     self.game_frame,
-                    text=str(self.game.grid[row][col]) if self.game.grid[row][col] != 0 else "",
                     font=('Arial', 16, 'bold'),
                     width=4,
                     height=2,
-                    command=lambda r=row, c=col: self.on_tile_click(r, c),
-                    bg='#bbdefb' if self.game.can_move_tile(row, col) else '#e0e0e0',
+                    command=lambda i=len(self.tile_buttons): self._on_index_click(i),
                     fg='white',
                     relief='raised',
                     bd=2
                 )
                 btn.grid(row=row, column=col, padx=2, pady=2)
-                button_row.append(btn)
-            self.tile_buttons.append(button_row)
+                self.tile_buttons.append(btn)
+    
+    def _refresh_tile(self, index: int):
+        """Update the text and color of the tile button at a flat index"""
+        game = self.game
+        num = game.grid[index]
+        row, col = divmod(index, game.size)
+        self.tile_buttons[index].config(
+            text=str(num) if num != 0 else "",
+            bg='#bbdefb' if game.can_move_tile(row, col) else '#e0e0e0'
+        )
+    
+    def _refresh_around(self, index: int):
+        """Refresh the tile at a flat index and its four neighbors"""
+        refresh = self._refresh_tile
+        refresh(index)
+        for neighbor in _neighbor_table(self.game.size)[index]:
+            refresh(neighbor)
+    
+    def _on_index_click(self, index: int):
+        """Route a click on the tile button at a flat index to on_tile_click"""
+        row, col = divmod(index, self.game.size)
+        self.on_tile_click(row, col)
     
     def on_tile_click(self, row: int, col: int):
         """Handle tile click"""
+        old_blank = self.game.blank_pos
         if self.game.move_tile(row, col):
-            self.update_display()
+            # Only the swapped cells and their neighbors change text or color
+            self._refresh_around(old_blank)
+            self._refresh_around(self.game.blank_pos)
+            self._update_stats()
             if self.game.is_solved():
                 self.show_win_message()
     
     def update_display(self):
         """Update the display"""
-        self.create_tile_buttons()
+        self._update_grid()
+        self._update_stats()
+    
+    def _update_grid(self):
+        """Update the tile grid"""
+        refresh = self._refresh_tile
+        for index in range(len(self.tile_buttons)):
+            refresh(index)
+    
+    def _update_stats(self):
+        """Update the moves and time labels"""
         self.moves_label.config(text=f"Moves: {self.game.stats.moves}")
         
-        # Update time
-        elapsed = self.game.get_elapsed_time()
-        minutes = int(elapsed // 60)
-        seconds = int(elapsed % 60)
+        # Update time from the tick counter instead of reading the clock
+        minutes, seconds = divmod(self._tick_seconds, 60)
         self.time_label.config(text=f"Time: {minutes:02d}:{seconds:02d}")
     
     def start_timer(self):
         """Start the timer"""
-        self.update_display()
-        self.root.after(1000, self.start_timer)
+        # Only the clock changes between ticks; leave the tiles alone
+        self._update_stats()
+        self._timer_id = self.root.after(1000, self._advance_timer)
+    
+    def _advance_timer(self):
+        """Count one second and schedule the next tick"""
+        self._tick_seconds += 1
+        self.start_timer()
+    
+    def _reset_timer(self):
+        """Zero the clock and restart the one-second tick from now"""
+        if self._timer_id is not None:
+            self.root.after_cancel(self._timer_id)
+        self._tick_seconds = 0
+        self.start_timer()
     
     def restart_game(self):
         """Restart the game"""
         self.game.generate_solvable_puzzle()
+        self._reset_timer()
         self.update_display()
     
     def change_difficulty(self):
@@ -364,14 +425,15 @@ class SlidingPuzzleGUI:
         self.game.difficulty = difficulties[next_index]
         self.game.size = self.game.difficulty.value
         self.game.generate_solvable_puzzle()
+        self._reset_timer()
         self.difficulty_label.config(text=f"Difficulty: {self.game.difficulty.name}")
+        self.create_tile_buttons()
         self.update_display()
     
     def show_win_message(self):
         """Show win message"""
-        elapsed = self.game.get_elapsed_time()
-        minutes = int(elapsed // 60)
-        seconds = int(elapsed % 60)
+        # Same clock as the time label, so the two always agree
+        minutes, seconds = divmod(self._tick_seconds, 60)
         
         message = f"🎉 Congratulations! 🎉\n\n"
         message += f"You solved the {self.game.difficulty.name} puzzle!\n"
@@ -385,14 +447,14 @@ class SlidingPuzzleGUI:
         """Show game information"""
         info = "Dynamic Sliding Puzzle Game - Python Implementation\n\n"
         info += "Key Features:\n"
-        info += "• AI-based solvability checker using inversion counts\n"
+        info += "• AI-based solvability checker using inversion parity\n"
         info += "• 100% solvable puzzles guaranteed\n"
         info += "• Progressive difficulty (3x3 to 6x6)\n"
         info += "• Real-time move validation\n"
         info += "• Cross-platform compatibility\n\n"
-        info += "This demonstrates the same core algorithms\n"
-        info += "as the SwiftUI implementation, proving\n"
-        info += "framework adaptability across languages."
+        info += "This applies the same solvability rule\n"
+        info += "as the SwiftUI implementation, in an\n"
+        info += "equivalent incremental form."
         
         messagebox.showinfo("About", info)
     
@@ -4,6 +4,11 @@ Test script to verify the core algorithms work correctly
 This demonstrates the same logic used in the SwiftUI implementation
 """
 
+import random
+from bisect import bisect_left
+
+from sliding_puzzle_python import Difficulty, SlidingPuzzleGame
+
 def test_solvability_algorithm():
     """Test the AI-based solvability checker"""
     print("Testing AI-based solvability algorithm...")
@@ -30,6 +35,16 @@ def test_solvability_algorithm():
         [13, 14, 15, 0]  # Blank at bottom-right
     ]
     
+    def count_inversions(arr):
+        """Reference inversion count for the documented solvability rule"""
+        seen = []
+        inversions = 0
+        for value in reversed(arr):
+            position = bisect_left(seen, value)
+            inversions += position
+            seen.insert(position, value)
+        return inversions
+    
     def check_solvability(puzzle):
         """Same algorithm as SwiftUI implementation"""
         size = len(puzzle)
@@ -38,11 +53,7 @@ def test_solvability_algorithm():
         flat_puzzle = [num for row in puzzle for num in row if num != 0]
         
         # Count inversions
-        inversions = 0
-        for i in range(len(flat_puzzle)):
-            for j in range(i + 1, len(flat_puzzle)):
-                if flat_puzzle[i] > flat_puzzle[j]:
-                    inversions += 1
+        inversions = count_inversions(flat_puzzle)
         
         # For odd-sized puzzles: solvable if inversions are even
         if size % 2 == 1:
@@ -166,6 +177,48 @@ def test_solution_detection():
     
     return is_solved(solved_puzzle) == True and is_solved(unsolved_puzzle) == False
 
+def test_game_solvability_parity():
+    """Test the game's incremental parity check against the inversion count rule"""
+    print("\nTesting game solvability parity against inversion counts...")
+    
+    def solvable_by_inversions(grid, size):
+        """Documented rule, evaluated from scratch on a flat grid"""
+        flat_puzzle = [num for num in grid if num != 0]
+        inversions = 0
+        for i in range(len(flat_puzzle)):
+            for j in range(i + 1, len(flat_puzzle)):
+                if flat_puzzle[i] > flat_puzzle[j]:
+                    inversions += 1
+        
+        if size % 2 == 1:
+            return inversions % 2 == 0
+        blank_from_bottom = size - grid.index(0) // size
+        return (inversions + blank_from_bottom) % 2 == 1
+    
+    all_passed = True
+    for difficulty in Difficulty:
+        mismatches = 0
+        for _ in range(100):
+            game = SlidingPuzzleGame(difficulty)
+            for _ in range(50):
+                game.move_tile(random.randrange(game.size), random.randrange(game.size))
+                if game.grid[game.blank_pos] != 0:
+                    mismatches += 1
+                if game._check_solvability() != solvable_by_inversions(game.grid, game.size):
+                    mismatches += 1
+            
+            # Swapping two tiles must make the check report unsolvable
+            game._make_solvable()
+            if game._check_solvability() or solvable_by_inversions(game.grid, game.size):
+                mismatches += 1
+        
+        status = "✓" if mismatches == 0 else "✗"
+        print(f"  {status} {difficulty.name}: {mismatches} mismatches (Expected: 0)")
+        if mismatches:
+            all_passed = False
+    
+    return all_passed
+
 def main():
     """Run all tests"""
     print("Dynamic Sliding Puzzle Game - Algorithm Verification")
@@ -174,7 +227,8 @@ def main():
     tests = [
         ("Solvability Algorithm", test_solvability_algorithm),
         ("Move Validation", test_move_validation),
-        ("Solution Detection", test_solution_detection)
+        ("Solution Detection", test_solution_detection),
+        ("Game Solvability Parity", test_game_solvability_parity)
     ]
     
     all_passed = True